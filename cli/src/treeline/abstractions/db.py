@@ -64,6 +64,20 @@ class Repository(ABC):
     async def get_account_by_external_id(self, external_id: str) -> Result[Account]:
         pass
 
+    @abstractmethod
+    async def get_account_id_map(self, external_id_key: str) -> Result[Dict[str, str]]:
+        """
+        Map external ids under a given key to account ids.
+
+        Args:
+            external_id_key: Key within each account's external_ids (e.g., "simplefin")
+
+        Returns:
+            Result containing dict mapping external id -> account id
+            Accounts without a value for the key are omitted.
+        """
+        pass
+
     @abstractmethod
     async def get_transactions_by_external_ids(
         self, external_ids: List[Dict[str, str]]
@@ -212,6 +226,17 @@ class Repository(ABC):
     ) -> Result[None]:
         pass
 
+    @abstractmethod
+    async def insert_integration_if_absent(
+        self, integration_name: str, integration_options: Dict[str, Any]
+    ) -> Result[bool]:
+        """Insert integration settings unless the integration already exists.
+
+        Returns:
+            Result containing True if a new integration was inserted
+        """
+        pass
+
     @abstractmethod
     async def list_integrations(self) -> Result[List[Dict[str, Any]]]:
         pass
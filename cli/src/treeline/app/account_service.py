@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone, date
 from decimal import Decimal
-from typing import List
+from typing import Dict, List
 from uuid import UUID, uuid4
 
 from treeline.abstractions import Repository
@@ -19,6 +19,10 @@ class AccountService:
         """Get all accounts."""
         return await self.repository.get_accounts()
 
+    async def get_account_id_map(self, external_id_key: str) -> Result[Dict[str, str]]:
+        """Map external ids under a given key (e.g., 'demo') to account ids."""
+        return await self.repository.get_account_id_map(external_id_key)
+
     async def create_account(
         self,
         name: str,
@@ -1,6 +1,6 @@
 """Service for database operations."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from treeline.abstractions import Repository
 from treeline.app.backup_service import BackupService
@@ -29,6 +29,15 @@ class DbService:
         cleaned_sql = self._clean_and_validate_sql(sql)
         return await self.repository.execute_write_query(cleaned_sql)
 
+    async def execute_write_batch(self, sqls: List[str]) -> Result:
+        """Execute several write queries in a single transaction and round-trip."""
+        statements = [
+            self._clean_and_validate_sql(sql).strip().rstrip(";") for sql in sqls
+        ]
+        # Separators go on their own line so a trailing "-- comment" can't swallow them
+        batch_sql = "\n;\n".join(["BEGIN TRANSACTION", *statements, "COMMIT"]) + "\n;"
+        return await self.repository.execute_write_query(batch_sql)
+
     def _clean_and_validate_sql(self, sql: str) -> str:
         # TODO: Implement SQL cleaning and validation
         return sql
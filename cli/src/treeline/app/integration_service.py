@@ -3,7 +3,7 @@
 from typing import Any, Dict, List
 
 from treeline.abstractions import IntegrationProvider, Repository
-from treeline.domain import Result
+from treeline.domain import Ok, Result
 
 
 class IntegrationService:
@@ -43,3 +43,40 @@ class IntegrationService:
             await self.repository.upsert_integration(integration_name, result.data)
 
         return result
+
+    async def create_integration_if_absent(
+        self,
+        integration_provider: IntegrationProvider,
+        integration_name: str,
+        integration_options: Dict[str, Any],
+    ) -> Result[bool]:
+        """Create an integration unless one with this name already exists.
+
+        The provider's create_integration is always called, even when the
+        integration already exists, so only use this with providers whose setup
+        has no side effects (e.g., demo). Providers that claim one-time tokens,
+        such as SimpleFIN, must go through create_integration instead.
+        Settings of an existing integration are left untouched.
+
+        Args:
+            integration_provider: The provider to use for setup
+            integration_name: Name of the integration (e.g., 'demo')
+            integration_options: Provider-specific options
+
+        Returns:
+            Result containing True if a new integration was stored, False if
+            nothing was inserted (an integration with this name already
+            existed, or the provider returned no settings to store)
+        """
+        result = await integration_provider.create_integration(
+            integration_name, integration_options
+        )
+        if not result.success:
+            return result
+
+        if not result.data:
+            return Ok(False)
+
+        return await self.repository.insert_integration_if_absent(
+            integration_name, result.data
+        )
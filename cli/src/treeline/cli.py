@@ -1,17 +1,15 @@
 """Treeline CLI - Personal finance in your terminal."""
 
-import asyncio
 import sys
 
 import typer
 from dotenv import load_dotenv
 from rich.console import Console
 
-from treeline.app.container import Container
 from treeline.commands import backfill, backup, compact, demo, doctor, encrypt, import_cmd, new, plugin, query, remove, setup, status, sync, tag
-from treeline.config import is_demo_mode
+from treeline.container import get_container
 from treeline.theme import get_theme
-from treeline.utils import get_treeline_dir
+from treeline.utils import get_treeline_dir, run_async
 
 # Load environment variables from .env file
 load_dotenv()
@@ -56,36 +54,6 @@ def main(
     _ = _version  # Used by callback
 
 
-# Global container instance
-_container: Container | None = None
-
-
-def _password_callback() -> str:
-    """Interactive password prompt for encrypted databases."""
-    from rich.prompt import Prompt
-    return Prompt.ask("Enter database password", password=True)
-
-
-def get_container() -> Container:
-    """Get or create the dependency injection container."""
-    global _container
-    if _container is None:
-        treeline_dir = get_treeline_dir()
-        db_filename = "demo.duckdb" if is_demo_mode() else "treeline.duckdb"
-        _container = Container(
-            str(treeline_dir),
-            db_filename,
-            password_callback=_password_callback,
-        )
-    return _container
-
-
-def reset_container() -> None:
-    """Reset the container (used when switching demo mode)."""
-    global _container
-    _container = None
-
-
 def ensure_treeline_initialized() -> bool:
     """Ensure treeline directory and database exist."""
     treeline_dir = get_treeline_dir()
@@ -95,7 +63,7 @@ def ensure_treeline_initialized() -> bool:
     container = get_container()
     db_service = container.db_service()
 
-    result = asyncio.run(db_service.initialize_db())
+    result = run_async(db_service.initialize_db())
     if not result.success:
         console.print(f"[{theme.error}]Error initializing database: {result.error}[/{theme.error}]")
         sys.exit(1)
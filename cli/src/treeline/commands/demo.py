@@ -1,19 +1,53 @@
 """Demo command - toggle demo mode with scenario support."""
 
-import asyncio
+import functools
+import os
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from enum import Enum
-from typing import Dict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, AsyncIterator, ClassVar, Dict, Mapping, NamedTuple
 
 import typer
-from rich.console import Console
 
 from treeline.config import is_demo_mode, set_demo_mode
-from treeline.utils import get_treeline_dir
+from treeline.container import reset_container
+from treeline.utils import get_treeline_dir, run_async
 from treeline.theme import get_theme
 
-console = Console()
-theme = get_theme()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
+    from treeline.app.account_service import AccountService
+    from treeline.app.container import Container
+    from treeline.app.db_service import DbService
+    from treeline.app.integration_service import IntegrationService
+    from treeline.app.sync_service import SyncService
+    from treeline.domain import Result
+    from treeline.infra.demo import DemoDataProvider
+
+
+@functools.cache
+def _get_console() -> "Console":
+    """Create the demo command's console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _styled_line(text: str, style: str) -> "Text":
+    """Build a highlighted line with the theme style layered on top.
+
+    The theme style is applied after highlighting so it wins over the
+    highlighter's colors, matching "[style]...[/style]" markup.
+    """
+    from rich.text import Text
+
+    line = Text(text)
+    _get_console().highlighter.highlight(line)
+    line.stylize(style)
+    return line
 
 
 # =============================================================================
@@ -28,20 +62,22 @@ class DemoScenarioBase(ABC):
     the details of each scenario's setup logic.
     """
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Scenario identifier used in CLI."""
-        pass
+    # Read from the class by the scenario registry, so these must be plain
+    # class attributes rather than properties
+    name: ClassVar[str]
+    """Scenario identifier used in CLI."""
 
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Human-readable description for help text."""
-        pass
+    description: ClassVar[str]
+    """Human-readable description for help text."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for attr in ("name", "description"):
+            if not isinstance(getattr(cls, attr, None), str):
+                raise TypeError(f"{cls.__name__} must define class attribute '{attr}' as a str")
 
     @abstractmethod
-    def setup(self, get_container: callable) -> None:
+    async def setup(self, get_container: callable) -> None:
         """Set up the scenario data in the demo database.
 
         Args:
@@ -53,129 +89,158 @@ class DemoScenarioBase(ABC):
 class EmptyScenario(DemoScenarioBase):
     """Empty database for testing new user experience."""
 
-    @property
-    def name(self) -> str:
-        return "empty"
-
-    @property
-    def description(self) -> str:
-        return "Empty database for testing new user experience"
+    name = "empty"
+    description = "Empty database for testing new user experience"
 
-    def setup(self, get_container: callable) -> None:
+    async def setup(self, get_container: callable) -> None:
         # Nothing to do - database is already empty after initialization
         pass
 
 
-class DefaultScenario(DemoScenarioBase):
-    """Full sample data with accounts, transactions, and budget."""
+class DemoSession(NamedTuple):
+    """Services resolved once for a demo scenario setup."""
 
-    @property
-    def name(self) -> str:
-        return "default"
+    integration_service: "IntegrationService"
+    sync_service: "SyncService"
+    demo_provider: "DemoDataProvider"
+    db_service: "DbService"
+    account_service: "AccountService"
 
-    @property
-    def description(self) -> str:
-        return "Full sample data (accounts, transactions, budget)"
 
-    def setup(self, get_container: callable) -> None:
-        """Load full demo data including accounts, transactions, and budget."""
-        container = get_container()
+def _exit_on_failure(result: "Result") -> None:
+    """Print the error and exit if a demo setup step failed."""
+    if not result.success:
+        _get_console().print(_styled_line(f"Error: {result.error}", style=get_theme().error))
+        raise typer.Exit(1)
 
-        # Create demo integration if it doesn't exist
-        integration_service = container.integration_service()
-        integrations_result = asyncio.run(integration_service.get_integrations())
 
-        has_demo = False
-        if integrations_result.success:
-            for integration in integrations_result.data or []:
-                if integration.get("integrationName") == "demo":
-                    has_demo = True
-                    break
+@asynccontextmanager
+async def demo_session(container: "Container") -> AsyncIterator[DemoSession]:
+    """Resolve demo services with the demo integration in place.
 
+    Setup steps report failures by raising (typer.Exit after printing the
+    error). On any failure the partially initialized demo database is deleted
+    and demo mode is switched back off, so the user lands on their real data
+    instead of a demo mode pointing at a missing database.
+    """
+    try:
+        integration_service = container.integration_service()
         demo_provider = container.get_integration_provider("demo")
 
-        if not has_demo:
-            asyncio.run(integration_service.create_integration(demo_provider, "demo", {}))
+        # Create demo integration if it doesn't exist
+        create_result = await integration_service.create_integration_if_absent(
+            demo_provider, "demo", {}
+        )
+        _exit_on_failure(create_result)
+
+        yield DemoSession(
+            integration_service=integration_service,
+            sync_service=container.sync_service(),
+            demo_provider=demo_provider,
+            db_service=container.db_service(),
+            account_service=container.account_service(),
+        )
+    except BaseException:
+        reset_container()
+        _delete_demo_database()
+        set_demo_mode(False)
+        _get_console().print(
+            _styled_line("Demo setup failed - demo mode disabled\n", style=get_theme().muted)
+        )
+        raise
+
+
+class DefaultScenario(DemoScenarioBase):
+    """Full sample data with accounts, transactions, and budget."""
+
+    name = "default"
+    description = "Full sample data (accounts, transactions, budget)"
+
+    async def setup(self, get_container: callable) -> None:
+        """Load full demo data including accounts, transactions, and budget."""
+        async with demo_session(get_container()) as session:
+            # Phase 1 must block: seeding needs the synced account ids
+            account_id_map = await self._sync_accounts(session)
+
+            # Phase 2: balance history and budget seeds go out together
+            await self._seed_demo_data(session, account_id_map)
+
+    async def _sync_accounts(self, session: DemoSession) -> Dict[str, str]:
+        """Sync the demo integration and map demo ids to account ids."""
+        console = _get_console()
+        theme = get_theme()
 
         # Sync demo accounts and transactions
-        sync_service = container.sync_service()
-        console.print(f"[{theme.muted}]Syncing demo data...[/{theme.muted}]")
+        console.print(_styled_line("Syncing demo data...", style=theme.muted))
         with console.status(f"[{theme.status_loading}]Syncing demo accounts and transactions..."):
-            result = asyncio.run(sync_service.sync_all_integrations())
+            result = await session.sync_service.sync_all_integrations()
 
-        if result.success:
-            console.print(f"[{theme.success}]Demo data synced successfully![/{theme.success}]")
-        else:
-            console.print(f"[{theme.warning}]Note: {result.error}[/{theme.warning}]")
-
-        # Generate balance history
-        db_service = container.db_service()
-        account_service = container.account_service()
-        accounts_result = asyncio.run(account_service.get_accounts())
-
-        if accounts_result.success and accounts_result.data:
-            account_id_map = {}
-            for account in accounts_result.data:
-                demo_id = account.external_ids.get("demo")
-                if demo_id:
-                    account_id_map[demo_id] = str(account.id)
-
-            if account_id_map:
-                with console.status(f"[{theme.status_loading}]Generating balance history..."):
-                    balance_sql = demo_provider.generate_demo_balance_history_sql(account_id_map)
-                    balance_result = asyncio.run(db_service.execute_write_query(balance_sql))
-
-                if balance_result.success:
-                    console.print(f"[{theme.success}]Created balance history for {len(account_id_map)} accounts[/{theme.success}]")
-                else:
-                    console.print(f"[{theme.warning}]Note: {balance_result.error}[/{theme.warning}]")
-
-        # Seed budget categories
-        with console.status(f"[{theme.status_loading}]Setting up demo budget..."):
-            budget_sql = demo_provider.generate_demo_budget_sql()
-            budget_result = asyncio.run(db_service.execute_write_query(budget_sql))
-
-        if budget_result.success:
-            console.print(f"[{theme.success}]Demo budget configured[/{theme.success}]")
-        else:
-            console.print(f"[{theme.warning}]Note: {budget_result.error}[/{theme.warning}]")
+        _exit_on_failure(result)
+        console.print(_styled_line("Demo data synced successfully!", style=theme.success))
+
+        id_map_result = await session.account_service.get_account_id_map("demo")
+        _exit_on_failure(id_map_result)
+        return id_map_result.data
+
+    async def _seed_demo_data(
+        self, session: DemoSession, account_id_map: Dict[str, str]
+    ) -> None:
+        """Write balance history and budget seeds in one transaction."""
+        console = _get_console()
+        theme = get_theme()
+
+        seed_sqls = []
+        if account_id_map:
+            seed_sqls.append(session.demo_provider.generate_demo_balance_history_sql(account_id_map))
+        seed_sqls.append(session.demo_provider.generate_demo_budget_sql())
+
+        with console.status(f"[{theme.status_loading}]Finalizing demo data..."):
+            seed_result = await session.db_service.execute_write_batch(seed_sqls)
+
+        _exit_on_failure(seed_result)
+
+        lines = []
+        if account_id_map:
+            lines.append(_styled_line(f"Created balance history for {len(account_id_map)} accounts", style=theme.success))
+        lines.append(_styled_line("Demo budget configured", style=theme.success))
+        console.print(*lines, sep="\n")
 
 
 # =============================================================================
 # Scenario Registry
 # =============================================================================
 
-# Register all available scenarios
-SCENARIOS: Dict[str, DemoScenarioBase] = {
-    scenario.name: scenario
-    for scenario in [
-        DefaultScenario(),
-        EmptyScenario(),
+# Register all available scenario classes; instances are only created when selected
+SCENARIOS: Mapping[str, type[DemoScenarioBase]] = MappingProxyType({
+    scenario_cls.name: scenario_cls
+    for scenario_cls in [
+        DefaultScenario,
+        EmptyScenario,
         # Future scenarios can be added here:
-        # MinimalScenario(),
-        # HeavyScenario(),
+        # MinimalScenario,
+        # HeavyScenario,
     ]
-}
-
-
-class ScenarioChoice(str, Enum):
-    """Enum for CLI scenario choices (auto-generated from registry)."""
-    DEFAULT = "default"
-    EMPTY = "empty"
-
-
-def _build_scenario_help() -> str:
-    """Build help text for available scenarios."""
-    lines = ["Available scenarios:"]
-    for scenario in SCENARIOS.values():
-        lines.append(f"  {scenario.name:<10} - {scenario.description}")
-    return "\n".join(lines)
+})
+
+# Enum for CLI scenario choices (auto-generated from registry)
+ScenarioChoice = Enum(
+    "ScenarioChoice", {name.upper(): name for name in SCENARIOS}, type=str
+)
+
+# Help text for available scenarios, built once from the registry
+_SCENARIO_HELP = "\n".join(
+    ["Available scenarios:"]
+    + [
+        f"  {scenario_cls.name:<10} - {scenario_cls.description}"
+        for scenario_cls in SCENARIOS.values()
+    ]
+)
 
 
 def register(app: typer.Typer, get_container: callable, ensure_initialized: callable) -> None:
     """Register the demo command with the app."""
 
-    @app.command(name="demo")
+    @app.command(name="demo", epilog=_SCENARIO_HELP)
     def demo_command(
         action: str = typer.Argument(
             None, help="Action: 'on', 'off', or 'status' (default: status)"
@@ -198,11 +263,10 @@ def register(app: typer.Typer, get_container: callable, ensure_initialized: call
           tl demo on --scenario empty   # Enable with empty database
           tl demo on -s empty           # Short form
           tl demo off                   # Disable demo mode
-
-        Available scenarios:
-          default  - Full sample data (accounts, transactions, budget)
-          empty    - Empty database for testing new user experience
         """
+        console = _get_console()
+        theme = get_theme()
+
         # Default to status if no action provided
         if action is None:
             action = "status"
@@ -212,41 +276,48 @@ def register(app: typer.Typer, get_container: callable, ensure_initialized: call
         if action_lower == "status":
             _show_status()
         elif action_lower == "on":
-            # Look up scenario from registry
-            scenario_impl = SCENARIOS.get(scenario.value)
-            if not scenario_impl:
-                console.print(f"[{theme.error}]Unknown scenario: {scenario.value}[/{theme.error}]")
-                raise typer.Exit(1)
-            _enable_demo(get_container, ensure_initialized, scenario_impl)
+            # ScenarioChoice is generated from SCENARIOS, so every choice is registered
+            _enable_demo(get_container, ensure_initialized, SCENARIOS[scenario.value]())
         elif action_lower == "off":
             _disable_demo()
         else:
-            console.print(f"[{theme.error}]Unknown action: {action}[/{theme.error}]")
-            console.print(f"[{theme.muted}]Use 'on', 'off', or 'status'[/{theme.muted}]")
+            console.print(
+                _styled_line(f"Unknown action: {action}", style=theme.error),
+                _styled_line("Use 'on', 'off', or 'status'", style=theme.muted),
+                sep="\n",
+            )
             raise typer.Exit(1)
 
 
 def _show_status() -> None:
     """Show current demo mode status."""
+    console = _get_console()
+    theme = get_theme()
     if is_demo_mode():
-        console.print(f"\n[{theme.warning}]Demo mode is ON[/{theme.warning}]")
-        console.print(f"[{theme.muted}]Using demo.duckdb with sample data[/{theme.muted}]")
-        console.print(f"[{theme.muted}]Run 'tl demo off' to switch to real data[/{theme.muted}]\n")
+        console.print(
+            _styled_line("\nDemo mode is ON", style=theme.warning),
+            _styled_line("Using demo.duckdb with sample data", style=theme.muted),
+            _styled_line("Run 'tl demo off' to switch to real data\n", style=theme.muted),
+            sep="\n",
+        )
     else:
-        console.print(f"\n[{theme.success}]Demo mode is OFF[/{theme.success}]")
-        console.print(f"[{theme.muted}]Using treeline.duckdb with real data[/{theme.muted}]")
-        console.print(f"[{theme.muted}]Run 'tl demo on' to try demo mode[/{theme.muted}]\n")
+        console.print(
+            _styled_line("\nDemo mode is OFF", style=theme.success),
+            _styled_line("Using treeline.duckdb with real data", style=theme.muted),
+            _styled_line("Run 'tl demo on' to try demo mode\n", style=theme.muted),
+            sep="\n",
+        )
 
 
 def _delete_demo_database() -> None:
     """Delete existing demo database for fresh start."""
-    demo_db_path = get_treeline_dir() / "demo.duckdb"
-    if demo_db_path.exists():
-        demo_db_path.unlink()
-        # Also remove WAL file if it exists
-        wal_path = demo_db_path.with_suffix(".duckdb.wal")
-        if wal_path.exists():
-            wal_path.unlink()
+    demo_db_path = os.path.join(get_treeline_dir(), "demo.duckdb")
+    # Also remove WAL file if it exists
+    for path in (demo_db_path, demo_db_path + ".wal"):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
 
 
 def _enable_demo(get_container: callable, ensure_initialized: callable, scenario: DemoScenarioBase) -> None:
@@ -257,34 +328,44 @@ def _enable_demo(get_container: callable, ensure_initialized: callable, scenario
         ensure_initialized: Function to initialize the database
         scenario: The scenario implementation to set up
     """
+    console = _get_console()
+    theme = get_theme()
+
     # Always delete existing demo database for fresh scenario
     _delete_demo_database()
 
     set_demo_mode(True)
 
     # Reset container to pick up new database
-    from treeline.cli import reset_container
     reset_container()
 
-    console.print(f"\n[{theme.success}]Demo mode enabled[/{theme.success}]")
-    console.print(f"[{theme.muted}]Scenario: {scenario.name} - {scenario.description}[/{theme.muted}]")
+    console.print(
+        _styled_line("\nDemo mode enabled", style=theme.success),
+        _styled_line(f"Scenario: {scenario.name} - {scenario.description}", style=theme.muted),
+        sep="\n",
+    )
 
     # Initialize demo database (runs migrations)
     ensure_initialized()
 
     # Delegate to scenario for setup - no if/else needed
-    scenario.setup(get_container)
+    run_async(scenario.setup(get_container))
 
-    console.print(f"\n[{theme.muted}]Run 'tl demo off' to return to real data[/{theme.muted}]\n")
+    console.print(_styled_line("\nRun 'tl demo off' to return to real data\n", style=theme.muted))
 
 
 def _disable_demo() -> None:
     """Disable demo mode."""
+    console = _get_console()
+    theme = get_theme()
     if not is_demo_mode():
-        console.print(f"[{theme.muted}]Demo mode is already disabled[/{theme.muted}]\n")
+        console.print(_styled_line("Demo mode is already disabled\n", style=theme.muted))
         return
 
     set_demo_mode(False)
-    console.print(f"\n[{theme.success}]Demo mode disabled[/{theme.success}]")
-    console.print(f"[{theme.muted}]Now using treeline.duckdb with real data[/{theme.muted}]")
-    console.print(f"[{theme.muted}]Run 'tl status' to see your data[/{theme.muted}]\n")
+    console.print(
+        _styled_line("\nDemo mode disabled", style=theme.success),
+        _styled_line("Now using treeline.duckdb with real data", style=theme.muted),
+        _styled_line("Run 'tl status' to see your data\n", style=theme.muted),
+        sep="\n",
+    )
@@ -0,0 +1,35 @@
+"""Process-wide dependency injection container for the CLI."""
+
+from treeline.app.container import Container
+from treeline.config import is_demo_mode
+from treeline.utils import get_treeline_dir
+
+# Global container instance
+_container: Container | None = None
+
+
+def _password_callback() -> str:
+    """Interactive password prompt for encrypted databases."""
+    from rich.prompt import Prompt
+
+    return Prompt.ask("Enter database password", password=True)
+
+
+def get_container() -> Container:
+    """Get or create the dependency injection container."""
+    global _container
+    if _container is None:
+        treeline_dir = get_treeline_dir()
+        db_filename = "demo.duckdb" if is_demo_mode() else "treeline.duckdb"
+        _container = Container(
+            str(treeline_dir),
+            db_filename,
+            password_callback=_password_callback,
+        )
+    return _container
+
+
+def reset_container() -> None:
+    """Reset the container (used when switching demo mode)."""
+    global _container
+    _container = None
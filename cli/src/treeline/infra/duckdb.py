@@ -445,6 +445,25 @@ class DuckDBRepository(Repository):
         # This requires JSON querying which DuckDB supports
         return Fail("Not implemented")
 
+    async def get_account_id_map(self, external_id_key: str) -> Result[Dict[str, str]]:
+        """Map external ids under a given key to account ids."""
+        try:
+            conn = self._get_connection(read_only=True)
+
+            result = conn.execute(
+                """
+                SELECT external_ids->>? AS external_id, account_id
+                FROM sys_accounts
+                WHERE COALESCE(external_ids->>?, '') <> ''
+                """,
+                [external_id_key, external_id_key],
+            ).fetchall()
+
+            conn.close()
+            return Ok(dict(result))
+        except Exception as e:
+            return Fail(f"Failed to get account id map: {str(e)}")
+
     async def get_transactions_by_external_ids(
         self, external_ids: List[Dict[str, str]]
     ) -> Result[List[Transaction]]:
@@ -715,6 +734,29 @@ class DuckDBRepository(Repository):
         except Exception as e:
             return Fail(f"Failed to upsert integration: {str(e)}")
 
+    async def insert_integration_if_absent(
+        self, integration_name: str, integration_options: Dict[str, Any]
+    ) -> Result[bool]:
+        """Insert integration settings unless the integration already exists."""
+        try:
+            conn = self._get_connection()
+
+            now = datetime.now(timezone.utc)
+            result = conn.execute(
+                """
+                INSERT INTO sys_integrations (integration_name, integration_settings, created_at, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (integration_name) DO NOTHING
+                RETURNING integration_name
+                """,
+                [integration_name, json.dumps(integration_options), now, now],
+            ).fetchone()
+
+            conn.close()
+            return Ok(result is not None)
+        except Exception as e:
+            return Fail(f"Failed to insert integration: {str(e)}")
+
     async def list_integrations(self) -> Result[List[Dict[str, Any]]]:
         """List all integrations."""
         try:
@@ -1,9 +1,19 @@
 """Utility functions for Treeline."""
 
+import atexit
 import logging
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Coroutine, TypeVar
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+# Event loop shared by every sync -> async bridge in a CLI invocation
+_event_loop: "asyncio.AbstractEventLoop | None" = None
 
 
 def get_treeline_dir() -> Path:
@@ -92,3 +102,33 @@ def get_logger(name: str = "treeline") -> logging.Logger:
     if name == "treeline":
         return logging.getLogger("treeline")
     return logging.getLogger(f"treeline.{name}")
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the shared CLI event loop.
+
+    The loop is created on first use and reused by later calls, so a command
+    that bridges into async code several times only pays for one loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    import asyncio
+
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop.run_until_complete(coro)
+
+
+@atexit.register
+def _close_event_loop() -> None:
+    """Close the shared CLI event loop at interpreter exit."""
+    global _event_loop
+    if _event_loop is not None and not _event_loop.is_closed():
+        _event_loop.run_until_complete(_event_loop.shutdown_asyncgens())
+        _event_loop.close()
+    _event_loop = None
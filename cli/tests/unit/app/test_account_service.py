@@ -0,0 +1,79 @@
+"""Unit tests for AccountService."""
+
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from treeline.app.account_service import AccountService
+from treeline.app.db_service import DbService
+from treeline.domain import Account
+from treeline.infra.duckdb import DuckDBRepository
+
+
+@pytest_asyncio.fixture
+async def repository():
+    """Create a migrated DuckDBRepository backed by a temporary file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repository = DuckDBRepository(str(Path(tmpdir) / "test.duckdb"))
+        init_result = await DbService(repository).initialize_db()
+        assert init_result.success, init_result.error
+        yield repository
+
+
+async def _add_account(
+    repository: DuckDBRepository, name: str, external_ids: Dict[str, str]
+) -> Account:
+    now = datetime.now(timezone.utc)
+    account = Account(
+        id=uuid4(),
+        name=name,
+        external_ids=external_ids,
+        created_at=now,
+        updated_at=now,
+    )
+    result = await repository.add_account(account)
+    assert result.success, result.error
+    return account
+
+
+@pytest.mark.asyncio
+async def test_get_account_id_map_maps_external_ids_to_account_ids(repository):
+    """Test that only accounts with a non-empty value for the key are mapped."""
+    checking = await _add_account(repository, "Checking", {"demo": "demo-checking-001"})
+    savings = await _add_account(
+        repository, "Savings", {"demo": "demo-savings-001", "simplefin": "sf-1"}
+    )
+    await _add_account(repository, "Other Provider", {"simplefin": "sf-2"})
+    await _add_account(repository, "No External Ids", {})
+    await _add_account(repository, "Empty Value", {"demo": ""})
+    null_account = await _add_account(repository, "Null Value", {})
+    null_write = await repository.execute_write_query(
+        f"""UPDATE sys_accounts SET external_ids = '{{"demo": null}}'
+        WHERE account_id = '{null_account.id}'"""
+    )
+    assert null_write.success, null_write.error
+
+    result = await AccountService(repository).get_account_id_map("demo")
+
+    assert result.success, result.error
+    assert result.data == {
+        "demo-checking-001": str(checking.id),
+        "demo-savings-001": str(savings.id),
+    }
+    assert all(isinstance(account_id, str) for account_id in result.data.values())
+
+
+@pytest.mark.asyncio
+async def test_get_account_id_map_without_matches_is_empty(repository):
+    """Test that a key no account uses yields an empty map."""
+    await _add_account(repository, "Checking", {"simplefin": "sf-1"})
+
+    result = await AccountService(repository).get_account_id_map("demo")
+
+    assert result.success, result.error
+    assert result.data == {}
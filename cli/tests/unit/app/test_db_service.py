@@ -0,0 +1,68 @@
+"""Unit tests for DbService."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from treeline.app.db_service import DbService
+from treeline.infra.duckdb import DuckDBRepository
+
+
+@pytest.fixture
+def db_service():
+    """Create a DbService backed by a temporary DuckDB file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repository = DuckDBRepository(str(Path(tmpdir) / "test.duckdb"))
+        yield DbService(repository)
+
+
+@pytest.mark.asyncio
+async def test_execute_write_batch_applies_all_statements(db_service):
+    """Test that every statement in a batch is committed."""
+    await db_service.execute_write_query("CREATE TABLE items (name VARCHAR)")
+
+    result = await db_service.execute_write_batch(
+        [
+            "INSERT INTO items VALUES ('a');",
+            "INSERT INTO items VALUES ('b'); INSERT INTO items VALUES ('c')",
+        ]
+    )
+
+    assert result.success
+    count_result = await db_service.execute_query("SELECT COUNT(*) FROM items")
+    assert count_result.data["rows"][0][0] == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_write_batch_rolls_back_on_failure(db_service):
+    """Test that a failing statement leaves earlier batch statements unapplied."""
+    await db_service.execute_write_query("CREATE TABLE items (name VARCHAR)")
+
+    result = await db_service.execute_write_batch(
+        [
+            "INSERT INTO items VALUES ('a')",
+            "INSERT INTO missing_table VALUES ('b')",
+        ]
+    )
+
+    assert not result.success
+    count_result = await db_service.execute_query("SELECT COUNT(*) FROM items")
+    assert count_result.data["rows"][0][0] == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_write_batch_handles_trailing_line_comments(db_service):
+    """Test that a statement ending in a line comment doesn't swallow the next one."""
+    await db_service.execute_write_query("CREATE TABLE items (name VARCHAR)")
+
+    result = await db_service.execute_write_batch(
+        [
+            "INSERT INTO items VALUES ('a') -- seed a",
+            "INSERT INTO items VALUES ('b')",
+        ]
+    )
+
+    assert result.success, result.error
+    count_result = await db_service.execute_query("SELECT COUNT(*) FROM items")
+    assert count_result.data["rows"][0][0] == 2
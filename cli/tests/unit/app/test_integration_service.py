@@ -0,0 +1,110 @@
+"""Unit tests for IntegrationService."""
+
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+import pytest_asyncio
+
+from treeline.abstractions import IntegrationProvider
+from treeline.app.db_service import DbService
+from treeline.app.integration_service import IntegrationService
+from treeline.domain import Fail, Ok, Result
+from treeline.infra.duckdb import DuckDBRepository
+
+
+class EchoIntegrationProvider(IntegrationProvider):
+    """Provider that returns the given options as settings and counts calls."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+
+    async def create_integration(
+        self, integration_name: str, integration_options: Dict[str, Any]
+    ) -> Result[Dict[str, Any]]:
+        self.calls += 1
+        if self.fail:
+            return Fail("setup failed")
+        return Ok(dict(integration_options))
+
+
+@pytest_asyncio.fixture
+async def integration_service():
+    """Create an IntegrationService backed by a migrated temporary DuckDB file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repository = DuckDBRepository(str(Path(tmpdir) / "test.duckdb"))
+        init_result = await DbService(repository).initialize_db()
+        assert init_result.success, init_result.error
+        yield IntegrationService(repository)
+
+
+@pytest.mark.asyncio
+async def test_create_integration_if_absent_inserts_new_integration(
+    integration_service,
+):
+    """Test that a missing integration is created and reported as inserted."""
+    result = await integration_service.create_integration_if_absent(
+        EchoIntegrationProvider(), "demo", {"token": "first"}
+    )
+
+    assert result.success
+    assert result.data is True
+    integrations = await integration_service.get_integrations()
+    assert integrations.data == [
+        {"integrationName": "demo", "integrationOptions": {"token": "first"}}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_integration_if_absent_keeps_existing_integration(
+    integration_service,
+):
+    """Test that an existing integration is left untouched and reported as not inserted."""
+    provider = EchoIntegrationProvider()
+    await integration_service.create_integration_if_absent(
+        provider, "demo", {"token": "first"}
+    )
+
+    result = await integration_service.create_integration_if_absent(
+        provider, "demo", {"token": "second"}
+    )
+
+    assert result.success
+    assert result.data is False
+    # The provider is still consulted on conflict - callers rely on it being side-effect free
+    assert provider.calls == 2
+    integrations = await integration_service.get_integrations()
+    assert integrations.data == [
+        {"integrationName": "demo", "integrationOptions": {"token": "first"}}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_integration_if_absent_propagates_provider_failure(
+    integration_service,
+):
+    """Test that a provider failure is returned and nothing is stored."""
+    result = await integration_service.create_integration_if_absent(
+        EchoIntegrationProvider(fail=True), "demo", {}
+    )
+
+    assert not result.success
+    integrations = await integration_service.get_integrations()
+    assert integrations.data == []
+
+
+@pytest.mark.asyncio
+async def test_create_integration_if_absent_with_empty_settings_inserts_nothing(
+    integration_service,
+):
+    """Test that a provider returning no settings stores nothing and reports False."""
+    result = await integration_service.create_integration_if_absent(
+        EchoIntegrationProvider(), "demo", {}
+    )
+
+    assert result.success
+    assert result.data is False
+    integrations = await integration_service.get_integrations()
+    assert integrations.data == []
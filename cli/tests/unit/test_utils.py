@@ -0,0 +1,65 @@
+"""Unit tests for treeline.utils."""
+
+import asyncio
+
+import pytest
+
+from treeline import utils
+
+
+@pytest.fixture(autouse=True)
+def fresh_event_loop():
+    """Ensure each test starts and ends without a shared CLI event loop."""
+    utils._close_event_loop()
+    yield
+    utils._close_event_loop()
+
+
+async def _current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+async def _add(a: int, b: int) -> int:
+    return a + b
+
+
+def test_run_async_returns_coroutine_result():
+    """Test that run_async returns the coroutine's result."""
+    assert utils.run_async(_add(2, 3)) == 5
+
+
+def test_run_async_reuses_one_loop():
+    """Test that consecutive run_async calls share the same event loop."""
+    first = utils.run_async(_current_loop())
+    second = utils.run_async(_current_loop())
+
+    assert first is second
+    assert utils._event_loop is first
+
+
+def test_run_async_recreates_closed_loop():
+    """Test that a closed shared loop is replaced on the next call."""
+    first = utils.run_async(_current_loop())
+    first.close()
+
+    second = utils.run_async(_current_loop())
+
+    assert second is not first
+    assert not second.is_closed()
+
+
+def test_close_event_loop_closes_and_resets():
+    """Test that _close_event_loop closes the shared loop and clears it."""
+    loop = utils.run_async(_current_loop())
+
+    utils._close_event_loop()
+
+    assert loop.is_closed()
+    assert utils._event_loop is None
+
+
+def test_close_event_loop_without_loop_is_noop():
+    """Test that _close_event_loop is safe to call before any loop exists."""
+    utils._close_event_loop()
+
+    assert utils._event_loop is None